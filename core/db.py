@@ -7,7 +7,7 @@ Usage (simplified)::
     db.initialize()  # create tables if first run
 
     s = db.start_session()
-    db.log_gps(s, lat, lon, speed)
+    db.log_gps(s, lat, lon, speed)   # buffered; see flush_gps()
     db.log_weather(s, **weather_dict)
     db.end_session(s)
 
@@ -17,6 +17,10 @@ All timestamps are stored in UTC.
 from __future__ import annotations
 
 import os
+import time
+import logging
+import atexit
+import threading
 import datetime as _dt
 from typing import Optional
 
@@ -29,7 +33,8 @@ from peewee import (
     FloatField,
     CharField,
     TextField,
-    ForeignKeyField
+    ForeignKeyField,
+    OperationalError,
 )
 
 
@@ -55,6 +60,11 @@ def _get_db_path() -> str:
 _db = SqliteDatabase(_get_db_path(), pragmas={
     "journal_mode": "wal",  # better concurrency
     "foreign_keys": 1,       # enforce FK constraints
+    "synchronous": "normal",  # durable with WAL, one fsync per checkpoint
+    "busy_timeout": 5000,    # ms to wait on a lock instead of erroring
+    "temp_store": "memory",
+    "cache_size": -8000,     # KiB (negative) → 8 MiB page cache
+    "mmap_size": 134217728,  # 128 MiB memory-mapped reads
 })
 
 
@@ -93,6 +103,10 @@ class GPSLog(_BaseModel):
     speed_kph = FloatField(null=True)
     est_depth_m = FloatField(null=True)
 
+    class Meta:
+        # serves "WHERE session = ? ORDER BY timestamp" with one index walk
+        indexes = ((("session", "timestamp"), False),)
+
 
 class Catch(_BaseModel):
     """Each fish caught."""
@@ -100,10 +114,10 @@ class Catch(_BaseModel):
     id = AutoField()
     session = ForeignKeyField(Session, backref="catches", on_delete="CASCADE")
     timestamp = DateTimeField()
-    species = CharField()
+    species = CharField(index=True)
     length_cm = FloatField(null=True)
     weight_kg = FloatField(null=True)
-    bait = CharField(null=True)
+    bait = CharField(null=True, index=True)
     notes = TextField(null=True)
     latitude = FloatField(null=True)
     longitude = FloatField(null=True)
@@ -128,6 +142,8 @@ def initialize() -> None:
     """Create tables if they don’t exist. Call once at app startup."""
     _db.connect(reuse_if_open=True)
     _db.create_tables([Session, GPSLog, Catch, WeatherLog])
+    logging.info("SQLite journal_mode=%s synchronous=%s",
+                 _db.journal_mode, _db.synchronous)
     _db.close()
 
 
@@ -136,8 +152,12 @@ def initialize() -> None:
 # ---------------------------------------------------------------------------
 
 
+_UTC = _dt.timezone.utc
+_now = _dt.datetime.now
+
+
 def _utcnow() -> _dt.datetime:
-    return _dt.datetime.utcnow().replace(tzinfo=_dt.timezone.utc)
+    return _now(_UTC)
 
 
 def start_session(notes: str | None = None) -> Session:
@@ -146,7 +166,8 @@ def start_session(notes: str | None = None) -> Session:
 
 
 def end_session(session: Session | int) -> None:
-    """Set *end_time* to now."""
+    """Flush queued GPS samples and set *end_time* to now."""
+    flush_gps()
     session_id = session.id if isinstance(session, Session) else session
     (Session
      .update({Session.end_time: _utcnow()})
@@ -154,6 +175,17 @@ def end_session(session: Session | int) -> None:
      .execute())
 
 
+# GPS samples arrive ~1 Hz; write them in batches so each sample doesn't pay
+# for its own INSERT + commit (one fsync per row on flash storage).
+_GPS_BATCH_N = 32        # flush once this many rows are queued …
+_GPS_BATCH_SEC = 10.0    # … or the oldest queued row is this old
+_GPS_BUFFER_MAX = 3600   # rows kept while the DB refuses writes (~1 h at 1 Hz)
+_gps_buffer: list[dict] = []
+_gps_lock = threading.Lock()
+_gps_first_queued = 0.0  # time.monotonic() when the buffer last became non-empty
+_gps_retry_at = 0.0      # after a failed flush, log_gps waits until then
+
+
 def log_gps(
     session: Session | int,
     latitude: float,
@@ -161,16 +193,68 @@ def log_gps(
     speed_kph: Optional[float] = None,
     est_depth_m: Optional[float] = None,
     timestamp: Optional[_dt.datetime] = None,
-) -> GPSLog:
-    """Add one GPS sample."""
-    return GPSLog.create(
-        session=session,
-        timestamp=timestamp or _utcnow(),
-        latitude=latitude,
-        longitude=longitude,
-        speed_kph=speed_kph,
-        est_depth_m=est_depth_m,
-    )
+) -> None:
+    """Queue one GPS sample; it is written with the next batch."""
+    global _gps_first_queued
+    row = {
+        "session": session,
+        "timestamp": timestamp or _utcnow(),
+        "latitude": latitude,
+        "longitude": longitude,
+        "speed_kph": speed_kph,
+        "est_depth_m": est_depth_m,
+    }
+    with _gps_lock:
+        now = time.monotonic()
+        if not _gps_buffer:
+            _gps_first_queued = now
+        _gps_buffer.append(row)
+        due = (now >= _gps_retry_at
+               and (len(_gps_buffer) >= _GPS_BATCH_N
+                    or now - _gps_first_queued >= _GPS_BATCH_SEC))
+    if due:
+        flush_gps()
+
+
+def flush_gps(raise_errors: bool = False) -> int:
+    """Write all queued GPS samples in one transaction; return the row count.
+
+    If the insert fails the rows stay queued (oldest dropped beyond
+    *_GPS_BUFFER_MAX*) and the error is logged, or re-raised when
+    *raise_errors* is set.
+    """
+    global _gps_first_queued, _gps_retry_at
+    with _gps_lock:
+        rows, first = _gps_buffer[:], _gps_first_queued
+        _gps_buffer.clear()
+    if not rows:
+        return 0
+    try:
+        log_gps_many(rows)              # outside the lock: log_gps never waits on I/O
+    except Exception as exc:
+        with _gps_lock:
+            _gps_buffer[:0] = rows      # keep order ahead of rows queued meanwhile
+            _gps_first_queued = first
+            overflow = len(_gps_buffer) - _GPS_BUFFER_MAX
+            if overflow > 0:
+                del _gps_buffer[:overflow]
+            _gps_retry_at = time.monotonic() + _GPS_BATCH_SEC
+        if raise_errors:
+            raise
+        logging.warning("GPS flush failed, %d rows kept for retry: %s",
+                        len(rows), exc)
+        return 0
+    return len(rows)
+
+
+def log_gps_many(rows: list[dict]) -> None:
+    """Insert many GPS samples (dicts of GPSLog columns) in one transaction."""
+    with _db.atomic():
+        for i in range(0, len(rows), 100):      # stay under SQLite's bind limit
+            GPSLog.insert_many(rows[i:i + 100]).execute()
+
+
+atexit.register(flush_gps)
 
 
 def log_catch(
@@ -220,34 +304,70 @@ def log_weather(
 # ---------------------------------------------------------------------------
 
 
+_TRACK_LENGTH_SQL = """
+WITH p AS (
+    SELECT latitude  AS lat2, LAG(latitude)  OVER w AS lat1,
+           longitude AS lon2, LAG(longitude) OVER w AS lon1
+    FROM gpslog
+    WHERE session_id = ?
+    WINDOW w AS (ORDER BY timestamp, id)
+)
+SELECT SUM(2 * 6371.0 * ASIN(SQRT(
+           SIN(RADIANS(lat2 - lat1) / 2) * SIN(RADIANS(lat2 - lat1) / 2)
+         + COS(RADIANS(lat1)) * COS(RADIANS(lat2))
+         * SIN(RADIANS(lon2 - lon1) / 2) * SIN(RADIANS(lon2 - lon1) / 2))))
+FROM p
+WHERE lat1 IS NOT NULL
+"""
+
+
+def _track_length_km(session_id: int) -> float:
+    """Haversine length of one session's track, summed inside SQLite.
+
+    Needs window functions plus the built-in math functions (SQLite ≥ 3.35
+    compiled with SQLITE_ENABLE_MATH_FUNCTIONS); older builds fall back to
+    :func:`_track_length_km_py`.
+    """
+    try:
+        (km,) = _db.execute_sql(_TRACK_LENGTH_SQL, (session_id,)).fetchone()
+    except OperationalError:
+        return _track_length_km_py(session_id)
+    return km or 0.0
+
+
+def _track_length_km_py(session_id: int) -> float:
+    """Same sum streamed in Python from (lat, lon) tuples."""
+    from math import radians, sin, cos, sqrt, asin
+
+    rows = (GPSLog
+            .select(GPSLog.latitude, GPSLog.longitude)
+            .where(GPSLog.session == session_id)
+            .order_by(GPSLog.timestamp, GPSLog.id)
+            .tuples()
+            .iterator())
+    total = 0.0
+    prev = None
+    for lat, lon in rows:
+        phi, lam = radians(lat), radians(lon)
+        cos_phi = cos(phi)
+        if prev is not None:
+            phi0, lam0, cos_phi0 = prev
+            a = sin((phi - phi0) / 2) ** 2 + cos_phi0 * cos_phi * sin((lam - lam0) / 2) ** 2
+            total += asin(sqrt(a))
+        prev = (phi, lam, cos_phi)
+    return 2 * 6371.0 * total  # km
+
+
 def get_session_summary(session: Session | int):
     """Return total catches, distance (km), duration (h) for one session."""
     session_id = session.id if isinstance(session, Session) else session
+    flush_gps()
 
     sess = Session.get_by_id(session_id)
 
     catches = Catch.select().where(Catch.session == session_id).count()
 
-    # distance: naive Haversine accumulation (development‑time only)
-    from math import radians, sin, cos, sqrt, atan2
-
-    def _haversine(lat1, lon1, lat2, lon2):
-        R = 6371.0  # km
-        dlat = radians(lat2 - lat1)
-        dlon = radians(lon2 - lon1)
-        a = sin(dlat / 2) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
-        c = 2 * atan2(sqrt(a), sqrt(1 - a))
-        return R * c
-
-    coords = list(
-        GPSLog
-        .select(GPSLog.latitude, GPSLog.longitude)
-        .where(GPSLog.session == session_id)
-        .order_by(GPSLog.timestamp)
-    )
-    dist = 0.0
-    for p1, p2 in zip(coords, coords[1:]):
-        dist += _haversine(p1.latitude, p1.longitude, p2.latitude, p2.longitude)
+    dist = _track_length_km(session_id)
 
     duration_h = None
     if sess.end_time:
@@ -270,8 +390,9 @@ def distinct_species() -> list[str]:
     rows = (Catch
             .select(Catch.species)
             .distinct()
-            .order_by(fn.LOWER(Catch.species)))
-    return [r.species for r in rows]
+            .order_by(fn.LOWER(Catch.species))
+            .tuples())
+    return [species for (species,) in rows]
 
 def distinct_baits() -> list[str]:
 
@@ -279,8 +400,24 @@ def distinct_baits() -> list[str]:
             .select(Catch.bait)
             .where(Catch.bait.is_null(False))   # exclude NULL
             .distinct()
-            .order_by(fn.LOWER(Catch.bait)))
-    return [r.bait for r in rows]
+            .order_by(fn.LOWER(Catch.bait))
+            .tuples())
+    return [bait for (bait,) in rows]
+
+_CHOICES_SQL = """
+SELECT 0, species FROM catch
+UNION
+SELECT 1, bait FROM catch WHERE bait IS NOT NULL
+ORDER BY 1, 2 COLLATE NOCASE
+"""
+
+def distinct_choices() -> tuple[list[str], list[str]]:
+    """(distinct_species(), distinct_baits()) in a single query."""
+    species: list[str] = []
+    baits: list[str] = []
+    for kind, value in _db.execute_sql(_CHOICES_SQL):
+        (baits if kind else species).append(value)
+    return species, baits
 
 
 # ---------------------------------------------------------------------------
@@ -18,8 +18,8 @@ from __future__ import annotations
 
 from typing import Callable, Optional, Tuple
 import sys
-import time
-import math
+from math import cos as _cos, sin as _sin
+from time import monotonic as _monotime
 
 # ---------------------------------------------------------------------------#
 # 0. Platform detection & Plyer import
@@ -33,6 +33,12 @@ except Exception:       # Desktop
 
 _IS_ANDROID = _PLYER_AVAILABLE and (sys.platform == "android")
 
+# desktop fake-GPS spiral
+_LAT0, _LON0 = 45.0, -122.0
+_RADIUS_COEF = 0.0002    # lat/lon degrees per second ≈ 22 m @ 45°N
+_OMEGA = 0.5             # rad per second
+_FAKE_SPEED_MPS = 1.5    # pretend 1.5 m/s (≈ 3 kn)
+
 # ---------------------------------------------------------------------------#
 # 1. Singleton Tracker
 # ---------------------------------------------------------------------------#
@@ -42,18 +48,21 @@ class GPSTracker:
     slow spiral pattern so charts have something to draw.
     """
 
+    __slots__ = ("_fix", "_last_key", "_enabled", "_subscribers", "_t0")
+
     _instance: "GPSTracker | None" = None
 
     # ------------------------- creation ---------------------------------- #
     def __init__(self) -> None:
-        self._lat: float = 0.0
-        self._lon: float = 0.0
-        self._speed_mps: float = 0.0
+        # (lat, lon, speed_mps).  Written by the GPS thread as one tuple swap
+        # so UI-thread readers never see lat from one fix and lon from another.
+        self._fix: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+        self._last_key: Optional[Tuple[float, float, float]] = None
         self._enabled: bool = False
         self._subscribers: list[Callable[[float, float, float], None]] = []
 
         # desktop fake-GPS state
-        self._t0 = time.time()
+        self._t0 = _monotime()
 
     @classmethod
     def get_instance(cls) -> "GPSTracker":
@@ -64,15 +73,16 @@ class GPSTracker:
     # ------------------------- public props ------------------------------ #
     @property
     def speed_kph(self) -> float:
-        return self._speed_mps * 3.6
+        return self._fix[2] * 3.6
 
     @property
     def speed_knots(self) -> float:
-        return self._speed_mps * 1.94384
+        return self._fix[2] * 1.94384
 
     @property
     def latlon(self) -> Tuple[float, float]:
-        return self._lat, self._lon
+        lat, lon, _ = self._fix
+        return lat, lon
 
     # ------------------------- lifecycle --------------------------------- #
     def start(self) -> None:
@@ -106,8 +116,13 @@ class GPSTracker:
     # ----------------------- subscriber pattern -------------------------- #
 
     def subscribe(self, cb):
-        """Register callback; return handle so caller can unsubscribe."""
-        self._subscribers.append(cb)
+        """Register callback; return handle so caller can unsubscribe.
+
+        Subscribing the same callback twice is a no-op, so a screen that
+        re-enters can't end up handling (and logging) every fix twice.
+        """
+        if cb not in self._subscribers:
+            self._subscribers.append(cb)
         return cb              # <‑‑ return value useful for later
 
     def unsubscribe(self, cb):
@@ -118,11 +133,22 @@ class GPSTracker:
 
     # ------------------------- callbacks --------------------------------- #
     def _on_location(self, **kw) -> None:
-        self._lat = float(kw.get("lat", 0.0))
-        self._lon = float(kw.get("lon", 0.0))
-        self._speed_mps = float(kw.get("speed", 0.0))
-        for fn in self._subscribers:
-            fn(self._lat, self._lon, self.speed_kph)
+        lat = float(kw.get("lat", 0.0))
+        lon = float(kw.get("lon", 0.0))
+        speed = float(kw.get("speed", 0.0))
+        # A stationary phone keeps re-reporting the same fix; don't fan it
+        # out again (DB insert, marker move, map redraw for nothing).
+        key = (round(lat, 6), round(lon, 6), round(speed, 2))
+        if key == self._last_key:
+            return
+        self._last_key = key
+        self._publish(lat, lon, speed)
+
+    def _publish(self, lat: float, lon: float, speed_mps: float) -> None:
+        self._fix = (lat, lon, speed_mps)      # the single visible mutation
+        speed_kph = speed_mps * 3.6
+        for fn in tuple(self._subscribers):    # snapshot: UI may unsubscribe
+            fn(lat, lon, speed_kph)
 
     def _on_status(self, stype, status) -> None:  # noqa: N802
         # For now, just print notable events
@@ -135,14 +161,10 @@ class GPSTracker:
         """
         Generates a ~25 m radius outward spiral to visualise motion on maps.
         """
-        t = time.time() - self._t0
-        radius = 0.0002 * t      # lat/lon degrees ≈ 22 m @ 45°N
-        angle = 0.5 * t
-        self._lat = 45.0000 + radius * math.cos(angle)
-        self._lon = -122.0000 + radius * math.sin(angle)
-        self._speed_mps = 1.5    # pretend 1.5 m/s (≈ 3 kn)
-        for fn in self._subscribers:
-            fn(self._lat, self._lon, self.speed_kph)
+        t = _monotime() - self._t0
+        r = _RADIUS_COEF * t
+        a = _OMEGA * t
+        self._publish(_LAT0 + r * _cos(a), _LON0 + r * _sin(a), _FAKE_SPEED_MPS)
 
 # ---------------------------------------------------------------------------#
 # 2. Convenience helper for other modules
@@ -152,7 +174,7 @@ def last_fix() -> Optional[Tuple[float, float, float]]:
     Returns *(lat, lon, speed_kph)* or **None** if no location seen yet.
     Call this from anywhere without importing GPSTracker explicitly.
     """
-    tr = GPSTracker.get_instance()
-    if tr._lat == tr._lon == 0.0 and tr._speed_mps == 0.0:
+    lat, lon, speed_mps = GPSTracker.get_instance()._fix
+    if lat == lon == speed_mps == 0.0:
         return None
-    return tr._lat, tr._lon, tr.speed_kph
+    return lat, lon, speed_mps * 3.6
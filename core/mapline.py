@@ -1,36 +1,129 @@
-# mapline.py  
+# mapline.py
+from __future__ import annotations
 
+from array import array
+from math import log, pi, radians, sin
+
+from kivy.clock import Clock                # type: ignore
 from kivy.uix.widget import Widget          # type: ignore
-from kivy.graphics import Color, Line       # type: ignore
+from kivy.graphics import (Color, Line,     # type: ignore
+                           PushMatrix, PopMatrix, Translate)
 from kivy_garden.mapview import MapView     # type: ignore
 
+_MAX_LAT = 85.0511287798                     # Web-Mercator latitude limit
+# Two fixed geo points used to read the map's current screen transform
+_REF_A = (0.0, 0.0)
+_REF_B = (45.0, 90.0)
+
+
+def _mercator(lat: float, lon: float) -> tuple[float, float]:
+    """Unit-square Web-Mercator coords; independent of zoom."""
+    lat = max(-_MAX_LAT, min(_MAX_LAT, lat))
+    s = sin(radians(lat))
+    return (lon + 180.0) / 360.0, 0.5 - log((1.0 + s) / (1.0 - s)) / (4.0 * pi)
+
+
 class MapLine(Widget):
     """Draws a red poly-line on top of a MapView."""
     def __init__(self, mapview: MapView, **kwargs):
         super().__init__(**kwargs)
         self.mapview = mapview
-        self.points_latlon: list[tuple[float, float]] = []
+
+        # Track stored column-wise: lat/lon as given, plus their Mercator
+        # projection computed once per point at add time.
+        self._lat = array("d")
+        self._lon = array("d")
+        self._mx = array("d")
+        self._my = array("d")
+
+        # Window = scale * mercator + offset.  The projected buffer is kept
+        # for the last (scale, offset); a pan only changes the offset, so it
+        # is applied with a Translate instead of re-projecting the track.
+        self._projected = array("f")
+        self._cached_xform: tuple[float, float, float, float] | None = None
+
+        # Instructions live for the widget's lifetime; redraws only update the
+        # Translate and, when the buffer changed, the Line's vertex list.
+        with self.canvas:
+            Color(1, 0, 0, 0.9)              # semi-opaque red
+            PushMatrix()
+            self._shift = Translate(0, 0)
+            self._line = Line(points=[], width=2)
+            PopMatrix()
+        self._uploaded = 0                   # len(_projected) last given to _line
+
+        # A drag fires `center` many times per frame; the trigger collapses
+        # them (and add_point calls) into at most one redraw per frame.
+        self._redraw_trigger = Clock.create_trigger(self._do_redraw, 0)
 
         # Redraw whenever the map pans / zooms / resizes
         self.bind(pos=self._redraw, size=self._redraw)
         self.mapview.bind(center=self._redraw, zoom=self._redraw)
 
     # Public -----------------------------------------------------------------
+    @property
+    def points_latlon(self) -> list[tuple[float, float]]:
+        return list(zip(self._lat, self._lon))
+
     def add_point(self, lat: float, lon: float) -> None:
-        self.points_latlon.append((lat, lon))
+        mx, my = _mercator(lat, lon)
+        self._lat.append(lat)
+        self._lon.append(lon)
+        self._mx.append(mx)
+        self._my.append(my)
+        xf = self._cached_xform
+        if xf is not None:
+            # store the new point in the cached frame
+            sx, ox, sy, oy = xf
+            self._projected.extend((sx * mx + ox, sy * my + oy))
+        self._redraw()
+
+    def clear(self) -> None:
+        """Drop all points; the widget and its canvas instructions are kept."""
+        for col in (self._lat, self._lon, self._mx, self._my):
+            del col[:]
+        self._projected = array("f")
+        self._cached_xform = None
         self._redraw()
 
     # Internal ---------------------------------------------------------------
+    def _transform(self) -> tuple[float, float, float, float]:
+        """(sx, ox, sy, oy) mapping unit Mercator to window coords right now."""
+        mv, zoom = self.mapview, self.mapview.zoom
+        xa, ya = mv.get_window_xy_from(*_REF_A, zoom)
+        xb, yb = mv.get_window_xy_from(*_REF_B, zoom)
+        mxa, mya = _mercator(*_REF_A)
+        mxb, myb = _mercator(*_REF_B)
+        sx = (xb - xa) / (mxb - mxa)
+        sy = (yb - ya) / (myb - mya)
+        return sx, xa - sx * mxa, sy, ya - sy * mya
+
+    def _reproject(self, xf: tuple[float, float, float, float]) -> None:
+        sx, ox, sy, oy = xf
+        self._projected = array("f", [v for x, y in zip(self._mx, self._my)
+                                      for v in (sx * x + ox, sy * y + oy)])
+        self._cached_xform = xf
+
     def _redraw(self, *_) -> None:
-        self.canvas.clear()
-        if len(self.points_latlon) < 2:
+        self._redraw_trigger()
+
+    def _do_redraw(self, *_) -> None:
+        if len(self._lat) < 2:
+            if self._uploaded:
+                self._line.points = []
+                self._uploaded = 0
             return
 
-        with self.canvas:
-            Color(1, 0, 0, 0.9)              # semi-opaque red
-            pts = []
-            for lat, lon in self.points_latlon:
-                x, y = self.mapview.get_window_xy_from(lat, lon,
-                                                       self.mapview.zoom)
-                pts += [x, y]
-            Line(points=pts, width=2)
+        xf = self._transform()
+        cached = self._cached_xform
+        if (cached is None
+                or abs(xf[0] - cached[0]) > 1e-9 * abs(cached[0])
+                or abs(xf[2] - cached[2]) > 1e-9 * abs(cached[2])):
+            self._reproject(xf)
+            cached = xf
+            self._uploaded = 0
+
+        self._shift.xy = (xf[1] - cached[1], xf[3] - cached[3])
+        if self._uploaded != len(self._projected):
+            self._line.points = list(self._projected)
+            self._uploaded = len(self._projected)
@@ -2,10 +2,19 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-import requests, logging, time
-from typing import Dict, Tuple, Optional, Union, Callable
+import requests, logging, time, asyncio, threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Tuple, Optional, Union, Callable
 from kivy.clock import Clock  # type: ignore
 
+try:                    # C parser when the build ships it
+    from orjson import loads as _json_loads  # type: ignore
+except ImportError:     # stdlib fallback
+    from json import loads as _json_loads
+
 # ---------- project- / param-IDs you care about ------------------------
 PROJECT_ID = 55                       # your WQDataLIVE project
 PARAM_IDS  = {
@@ -18,29 +27,135 @@ PARAM_IDS  = {
     57011: "dominant_wave_direction_deg",
     57013: "max_wave_ft",
 }
+_PARAM_ITEMS: Tuple[Tuple[int, str], ...] = tuple(PARAM_IDS.items())
+_PARAM_LIST: List[int] = list(PARAM_IDS)
+
+# Values computed once per fetch from the raw readings (see Weather._apply)
+_DERIVED: Dict[str, Callable[[dict], Union[float, str, None]]] = {
+    "air_temp_c":     lambda d: None if d["air_temp_f"] is None
+                                else (d["air_temp_f"] - 32) * 5 / 9,
+    "wind_speed_kph": lambda d: None if d["wind_speed_mph"] is None
+                                else d["wind_speed_mph"] * 1.60934,
+}
+_PARAM_KEYS = frozenset(PARAM_IDS.values()) | frozenset(_DERIVED)
+_COMPASS8 = ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
+
+# ---------- shared HTTP session -----------------------------------------
+# One keep-alive pool for every parameter fetch: the refresh fan-out reuses
+# the same TLS connection(s) instead of handshaking once per parameter.
+# Dropped connections and gateway errors are retried with backoff.  The
+# POSTs only read data, so retrying them is safe (hence allowed_methods).
+_RETRY = Retry(total=3, backoff_factor=0.5,
+               status_forcelist=(502, 503, 504),
+               allowed_methods=frozenset({"POST"}))
+_TIMEOUT = (3, 7)        # (connect, read) seconds; a slow connect can't eat the read budget
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=16,
+                                       pool_block=False, max_retries=_RETRY))
+
+# Worker threads for the per-parameter fallback fan-out; kept for the app's
+# lifetime so a refresh doesn't spawn and join eight new threads each time.
+_POOL = ThreadPoolExecutor(max_workers=len(PARAM_IDS), thread_name_prefix="weather")
+_closed = False          # set by close(); no fetch may start afterwards
+
+def close() -> None:
+    """Release the shared HTTP pool and workers (call once from App.on_stop).
+
+    Module-wide: every Weather instance stops fetching after this.
+    """
+    global _closed
+    _closed = True
+    _POOL.shutdown(wait=False)
+    _SESSION.close()
 
 # ---------- low-level helper ------------------------------------------
 def _latest(project_id: int, param_id: int) -> Tuple[datetime, float]:
     """Return (UTC-timestamp, value) for the newest sample of one parameter."""
     url  = f"https://www.wqdatalive.com/public/{project_id}/data"
-    resp = requests.post(url, data={"paramID": param_id}, timeout=10)
+    resp = _SESSION.post(url, data={"paramID": param_id}, timeout=_TIMEOUT)
     resp.raise_for_status()
-    js   = resp.json()
+    js   = _json_loads(resp.content)
     if js.get("error"):
         raise RuntimeError(js["error"])
 
     ts_ms, value = js["data"][-1]          # newest sample is last
     return datetime.fromtimestamp(ts_ms / 1_000, tz=timezone.utc), float(value)
 
+def _latest_batch(project_id: int, param_ids: List[int], joined: bool = False
+                  ) -> Dict[int, Tuple[datetime, float]]:
+    """Newest sample of several parameters in a single POST.
+
+    Param IDs go out as repeated ``paramID`` keys, or comma-joined in one key
+    when *joined*.  Raises ``ValueError`` when the reply is not keyed by
+    parameter, i.e. the server ignored the batch.
+    """
+    url  = f"https://www.wqdatalive.com/public/{project_id}/data"
+    if joined:
+        form = {"paramID": ",".join(map(str, param_ids))}
+    else:
+        form = [("paramID", pid) for pid in param_ids]
+    resp = _SESSION.post(url, data=form, timeout=_TIMEOUT)
+    resp.raise_for_status()
+    js   = _json_loads(resp.content)
+    if js.get("error"):
+        raise RuntimeError(js["error"])
+
+    series = js.get("data")
+    if not isinstance(series, dict):
+        raise ValueError("batch request not supported by server")
+
+    out: Dict[int, Tuple[datetime, float]] = {}
+    for pid in param_ids:
+        samples = series.get(str(pid)) or series.get(pid)
+        if samples:
+            ts_ms, value = samples[-1]
+            out[pid] = (datetime.fromtimestamp(ts_ms / 1_000, tz=timezone.utc),
+                        float(value))
+    return out
+
+def _deg_to_compass8(deg: Optional[float]) -> Optional[str]:
+    """Convert a bearing in degrees to one of the eight compass points."""
+    # Shift by half a sector so each point owns ±22.5°, floor-divide into
+    # 45° sectors, wrap with & 7 (8 is a power of two; works for negatives)
+    return None if deg is None else _COMPASS8[int((deg + 22.5) // 45) & 7]
+
+def _fetch_one(project_id: int, pid: int, key: str
+               ) -> Tuple[str, Optional[datetime], Optional[float]]:
+    """Worker for the refresh pool: one failed param yields (key, None, None)."""
+    try:
+        ts, val = _latest(project_id, pid)
+    except Exception as exc:
+        logging.warning("Weather param %s (%d) failed: %s", key, pid, exc)
+        return key, None, None
+    return key, ts, val
+
 # ---------- public convenience layer ----------------------------------
 class Weather:
-    """Fetches buoy parameters and caches them for *CACHE_SEC* seconds."""
+    """Fetches buoy parameters and caches them for *ttl_seconds* (default *CACHE_SEC*).
+
+    Stale-while-revalidate: for *SWR_SEC* past the TTL the old snapshot keeps
+    being served while a background fetch replaces it; after that it is
+    dropped so the UI shows dashes instead of outdated readings.
+    """
     CACHE_SEC = 600          # 10 min
+    SWR_SEC   = 1800         # 30 min of serving stale data while revalidating
     POLL_SEC  = 1800         # 30 min
+    RETRY_SEC = 30           # first retry after a failed fetch; doubles up to POLL_SEC
+    BATCH_REJECTS = 2        # drop a batch encoding after this many rejected replies
 
-    def __init__(self, project_id: int = PROJECT_ID, db_hook: Callable | None = None):
-        ...
-        self._last_fetch = 0.0
+    def __init__(self, project_id: int = PROJECT_ID, db_hook: Callable | None = None,
+                 ttl_seconds: float = CACHE_SEC):
+        # state read by __getattr__ must exist before the first fetch lands
+        self.data: Dict[str, Union[float, str, None]] = dict.fromkeys(_PARAM_KEYS)
+        self.time_utc: Optional[datetime] = None
+        self._refresh_hooks: List[Callable] = []
+        self.refresh_count = 0          # bumped whenever `data` is replaced
+        self.ttl_seconds = ttl_seconds
+        self._last_fetch = float("-inf")   # time.monotonic() of last good fetch
+        self._retry_sec  = self.RETRY_SEC   # backoff for the next failed fetch
+        self._retry_ev   = None             # pending retry, at most one
+        self._batch_forms = {False: 0, True: 0}   # `joined` encoding -> rejections so far
+        self._inflight   = threading.Lock()   # held while a fetch is running
         self._db_hook    = db_hook      # called with (weather_obj) after each *new* fetch
         self.project_id = project_id
 
@@ -49,56 +164,174 @@ class Weather:
         self.refresh(force=True)        # first download right away
 
     def __getattr__(self, name: str) -> Union[float, str, None]:
-        if name in PARAM_IDS.values():
+        if name in _PARAM_KEYS:
             return self.data.get(name)
         raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
 
-       # ── allow app to register a post‑refresh callback ───────────────
-    def set_refresh_hook(self, fn):
-        """fn(weather_obj) is called *only* when new data was downloaded."""
-        self._on_refresh = fn
+    # compass strings: computed on first read per snapshot, not per fetch
+    @cached_property
+    def wind_direction_compass(self) -> Optional[str]:
+        return _deg_to_compass8(self.data.get("wind_direction_deg"))
+
+    @cached_property
+    def dominant_wave_direction_compass(self) -> Optional[str]:
+        return _deg_to_compass8(self.data.get("dominant_wave_direction_deg"))
+
+    def _drop_cached(self) -> None:
+        self.__dict__.pop("wind_direction_compass", None)
+        self.__dict__.pop("dominant_wave_direction_compass", None)
+
+       # ── allow app / screens to register post‑refresh callbacks ──────
+    def add_refresh_hook(self, fn):
+        """fn(weather_obj) is called on the Kivy thread whenever `data` changes."""
+        if fn not in self._refresh_hooks:
+            self._refresh_hooks.append(fn)
+
+    def remove_refresh_hook(self, fn):
+        if fn in self._refresh_hooks:
+            self._refresh_hooks.remove(fn)
+
+    def _notify(self) -> None:
+        for fn in tuple(self._refresh_hooks):   # a hook may remove itself
+            fn(self)
 
     # ── main entry point ─────────────────────────────────────────────
 
     def refresh(self, force: bool = False) -> None:
-        if not force and time.time() - self._last_fetch < self.CACHE_SEC:
+        """Start a background fetch unless the cache is fresh or one is running.
+
+        Never blocks the caller; results land on the Kivy thread via _apply().
+        """
+        self._expire_stale()
+        if not self._needs_fetch(force):
             return
+        if not self._inflight.acquire(blocking=False):
+            return                      # overlapping ticks collapse into one fetch
+        threading.Thread(target=self._fetch_in_background,
+                         name="weather-refresh", daemon=True).start()
 
+    def _needs_fetch(self, force: bool) -> bool:
+        """False while the cache is fresh (or after close())."""
+        if _closed:
+            return False
+        return force or time.monotonic() - self._last_fetch >= self.ttl_seconds
+
+    def _expire_stale(self) -> None:
+        """Past the stale window, drop the old snapshot so views show dashes."""
+        if self.time_utc is None:
+            return
+        if time.monotonic() - self._last_fetch >= self.ttl_seconds + self.SWR_SEC:
+            self.data = dict.fromkeys(_PARAM_KEYS)
+            self.time_utc = None
+            self.refresh_count += 1
+            self._drop_cached()
+            self._notify()
+
+    def _fetch_in_background(self) -> None:
         try:
-            latest_time = None
-            buf: Dict[str, Union[float, str]] = {}
-            for pid, key in PARAM_IDS.items():
-                ts, val = _latest(self.project_id, pid)
-                buf[key] = val
-                if latest_time is None or ts > latest_time:
-                    latest_time = ts
-        except Exception as exc:
-            logging.warning("Weather refresh failed: %s", exc)
+            got = self._do_fetch()
+        finally:
+            self._inflight.release()
+        if got is not None:
+            Clock.schedule_once(lambda *_: self._apply(*got), 0)
+        else:
+            self._schedule_retry()
+
+    def _schedule_retry(self) -> None:
+        """Retry a failed fetch with backoff instead of waiting for the poll."""
+        if _closed:
             return
+        delay, self._retry_sec = self._retry_sec, min(self._retry_sec * 2, self.POLL_SEC)
+        if self._retry_ev is not None:
+            self._retry_ev.cancel()
+        self._retry_ev = Clock.schedule_once(lambda *_: self.refresh(), delay)
+
+    def _do_fetch(self) -> Optional[Tuple[Dict[str, Union[float, str, None]], datetime]]:
+        """Network half of a refresh; returns (values, newest timestamp) or None."""
+        results = None
+        if self._batch_forms:
+            try:
+                results = self._fetch_batch()
+            except requests.RequestException as exc:   # network: per-param would fail too
+                logging.warning("Weather refresh failed: %s", exc)
+                return None
+        if _closed:                     # close() ran while the batch was in flight
+            return None
+        if results is None:
+            # all params hit the same host and are purely I/O-bound → overlap them
+            results = list(_POOL.map(lambda item: _fetch_one(self.project_id, *item),
+                                     _PARAM_ITEMS))
+        if results is None:
+            return None
+
+        stamps = [ts for _, ts, _ in results if ts is not None]
+        if not stamps:
+            logging.warning("Weather refresh failed: no parameter could be fetched")
+            return None
+        self._last_fetch = time.monotonic()
+        self._retry_sec  = self.RETRY_SEC
+        return {key: val for key, _, val in results}, max(stamps)
 
+    def _apply(self, buf: Dict[str, Union[float, str, None]], latest_time: datetime) -> None:
+        """Publish a fetched snapshot; runs on the Kivy main thread."""
         self.time_utc = latest_time
         self.data     = buf
-        self._last_fetch = time.time()
+        self.refresh_count += 1
 
         # derived fields
-        if self.wind_direction_deg is not None:
-            self.data["wind_direction_compass"] = self.deg_to_compass8(self.wind_direction_deg)
-        if self.dominant_wave_direction_deg is not None:
-            self.data["dominant_wave_direction_compass"] = self.deg_to_compass8(
-                self.dominant_wave_direction_deg
-            )
+        for key, fn in _DERIVED.items():
+            buf[key] = fn(buf)
+        self._drop_cached()
 
         if self._db_hook:
             self._db_hook(self)
-            
-    def deg_to_compass8(self, deg: float):
-        '''Convert a bearing in degrees to one of the eight compass points.'''
-        directions = ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
-        # Divide by 45°, round to nearest index, wrap around with modulo
-        if deg:
-            idx = round(deg / 45) % 8
-            return directions[idx]
-        return
+        self._notify()
 
+    def _fetch_batch(self) -> Optional[List[Tuple[str, Optional[datetime], Optional[float]]]]:
+        """One round-trip for all params; None if no batch encoding worked.
 
+        Network errors propagate as ``requests.RequestException``.  Any other
+        failure counts against that encoding, which is dropped for good after
+        *BATCH_REJECTS* of them; on None the caller fetches per parameter.
+        """
+        for joined in tuple(self._batch_forms):
+            try:
+                got = _latest_batch(self.project_id, _PARAM_LIST, joined=joined)
+            except requests.HTTPError as exc:
+                if exc.response is None or exc.response.status_code != 400:
+                    raise
+                reason: object = exc
+            except requests.RequestException:
+                raise
+            except (RuntimeError, ValueError, KeyError, TypeError) as exc:
+                reason = exc                # {"error": ...} or not a batch reply
+            else:
+                if got:
+                    self._batch_forms[joined] = 0
+                    return [(key, *got.get(pid, (None, None))) for pid, key in _PARAM_ITEMS]
+                reason = "no requested parameter in reply"
 
+            rejects = self._batch_forms[joined] + 1
+            logging.info("Weather batch form joined=%s rejected (%d): %s",
+                         joined, rejects, reason)
+            if rejects >= self.BATCH_REJECTS:
+                del self._batch_forms[joined]
+            else:
+                self._batch_forms[joined] = rejects
+        return None
+
+    async def refresh_async(self, force: bool = False) -> None:
+        """Awaitable refresh for apps running Kivy under asyncio (async_run)."""
+        self._expire_stale()
+        if not self._needs_fetch(force):
+            return
+        if not self._inflight.acquire(blocking=False):
+            return
+        try:
+            got = await asyncio.to_thread(self._do_fetch)
+        finally:
+            self._inflight.release()
+        if got is not None:
+            self._apply(*got)
+        else:
+            self._schedule_retry()
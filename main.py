@@ -14,6 +14,7 @@ Config.set('input', 'mouse', 'mouse,multitouch_on_demand')
 # 3. Core services
 from core import db
 from core.gps_utils import GPSTracker, last_fix
+from core import waves
 from core.waves     import Weather
 
 # 4. UI screens (these modules define and register their popups)
@@ -28,10 +29,14 @@ Factory.register("WeatherPopup", cls=WeatherPopup)
 db.initialize()
 
 # 1. load all KV files up‑front
+#    Release builds (python -O) use the single file made by tools/bake_kv.py.
 KV_DIR = Path(__file__).parent / "ui" / "kv"
-for kv in ("main.kv", "catch.kv", "home.kv", "weather.kv",
-           "track.kv", "logbook.kv"):
-    Builder.load_file(str(KV_DIR / kv))
+if not __debug__ and (KV_DIR / "_all.kv").exists():
+    Builder.load_file(str(KV_DIR / "_all.kv"))
+else:
+    for kv in ("main.kv", "catch.kv", "home.kv", "weather.kv",
+               "track.kv", "logbook.kv"):
+        Builder.load_file(str(KV_DIR / kv))
 
 # 2. minimalist Root
 class Root(ScreenManager):
@@ -57,8 +62,8 @@ class FishTrackerApp(App):
 
         db.log_weather(
             session,
-            temp_c   = (w.air_temp_f - 32) * 5/9 if w.air_temp_f else None,
-            wind_kph = w.wind_speed_mph * 1.60934 if w.wind_speed_mph else None,
+            temp_c   = w.air_temp_c,
+            wind_kph = w.wind_speed_kph,
             conditions = f"W{w.wind_speed_mph or 0}mph"
                          f"/Sig{w.sig_wave_ft or 0}ft",
         )
@@ -75,7 +80,41 @@ class FishTrackerApp(App):
         # 3. go back to “home”
         self.root.current = "home"
 
-    # unchanged save_catch / on_stop …
+    def on_stop(self):
+        self.gps.stop()
+        waves.close()
+        db.flush_gps()
+
+    # ── catch logging ────────────────────────────────────────────────
+    _choices_cache = None       # (species, baits) until the next save
+
+    def get_catch_choices(self):
+        """Species / bait lists for LogCatchPopup; one query, then cached."""
+        if self._choices_cache is None:
+            self._choices_cache = db.distinct_choices()
+        return self._choices_cache
+
+    def save_catch(self, species, bait, length_in, notes):
+        """Called by the Save button in catch.kv."""
+        if not species or species == "Select Species":
+            return
+        session = getattr(self, "current_session", None)
+        if session is None:
+            session = db.start_session()
+            self.current_session = session
+        try:
+            length_cm = float(length_in) * 2.54 if length_in else None
+        except ValueError:
+            length_cm = None
+        lat, lon, _ = last_fix() or (None, None, None)
+
+        db.log_catch(
+            session, species, lat, lon,
+            length_cm = length_cm,
+            bait      = bait if bait and bait != "Select Bait" else None,
+            notes     = notes or None,
+        )
+        self._choices_cache = None   # a new species / bait may have appeared
 
 if __name__ == "__main__":
     FishTrackerApp().run()
@@ -0,0 +1,40 @@
+"""
+tools/bake_kv.py
+================
+
+Concatenate the app's KV files into ``ui/kv/_all.kv`` so a release build
+parses one file at start-up instead of six.
+
+    python tools/bake_kv.py
+
+Run it before ``buildozer android release``.  main.py only loads the baked
+file when Python runs optimised (``python -O``, ``__debug__`` is False);
+development runs keep loading the individual files so edits show up
+without re-baking.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+KV_DIR = Path(__file__).resolve().parent.parent / "ui" / "kv"
+BAKED = KV_DIR / "_all.kv"
+
+# Same order as the loader loop in main.py — rules may depend on it.
+KV_FILES = ("main.kv", "catch.kv", "home.kv", "weather.kv",
+            "track.kv", "logbook.kv")
+
+
+def bake() -> Path:
+    parts = []
+    for name in KV_FILES:
+        text = (KV_DIR / name).read_text(encoding="utf-8")
+        parts.append(f"# ---- {name} " + "-" * (70 - len(name)) + "\n"
+                     + text.rstrip() + "\n")
+    BAKED.write_text("# Generated by tools/bake_kv.py – do not edit.\n\n"
+                     + "\n".join(parts), encoding="utf-8")
+    return BAKED
+
+
+if __name__ == "__main__":
+    print(f"wrote {bake()}")
@@ -1,8 +1,7 @@
 from kivy.uix.popup import Popup  # type: ignore
 from kivy.properties import StringProperty, ListProperty  # type: ignore
 from kivy.factory import Factory  # type: ignore
-
-from core import db
+from kivy.app import App  # type: ignore
 
 class LogCatchPopup(Popup):
     init_bait_text    = StringProperty("Select Bait")
@@ -11,7 +10,8 @@ class LogCatchPopup(Popup):
     species_choices   = ListProperty()
 
     def on_open(self):
-        self.species_choices = db.distinct_species() or ["Bass", "Perch", "Walleye"]
-        self.bait_choices    = db.distinct_baits()    or ["Crankbait", "Worm", "Minnow"]
+        species, baits = App.get_running_app().get_catch_choices()
+        self.species_choices = species or ["Bass", "Perch", "Walleye"]
+        self.bait_choices    = baits   or ["Crankbait", "Worm", "Minnow"]
 
 Factory.register("LogCatchPopup", cls=LogCatchPopup)
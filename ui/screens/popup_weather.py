@@ -9,16 +9,26 @@ class WeatherPopup(Popup):
     temp  = NumericProperty(0)
 
     def on_open(self):
-        self.update_labels()
-        self._event = Clock.schedule_interval(lambda *_: self.update_labels(), 600)
+        self._weather = App.get_running_app().weather
+        self._wx_count = -1          # Weather.refresh_count last shown
+        self._trigger = Clock.create_trigger(self._tick, 600)
+        self._weather.add_refresh_hook(self.update_labels)   # new data lands
+        self._tick()
 
     def on_dismiss(self):
-        if hasattr(self, "_event"):
-            self._event.cancel()
+        if hasattr(self, "_trigger"):
+            self._trigger.cancel()
+            self._weather.remove_refresh_hook(self.update_labels)
+
+    def _tick(self, *_):
+        self.update_labels()
+        self._trigger()          # re-arm
 
-    def update_labels(self):
-        w = App.get_running_app().weather
-        w.refresh()
-        self.wind = w.wind_speed_mph or 0
-        self.wave = w.sig_wave_ft or 0
-        self.temp = w.air_temp_f or 0
+    def update_labels(self, *_):
+        w = self._weather
+        if w.refresh_count == self._wx_count:
+            return                   # same snapshot as on screen
+        self._wx_count = w.refresh_count
+        new = (w.wind_speed_mph or 0, w.sig_wave_ft or 0, w.air_temp_f or 0)
+        if new != (self.wind, self.wave, self.temp):
+            self.wind, self.wave, self.temp = new
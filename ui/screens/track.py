@@ -1,4 +1,5 @@
 # ui/screens/track.py
+from math import cos, radians
 from pathlib import Path
 
 from kivy.app import App                          # type: ignore
@@ -12,12 +13,37 @@ from core import db
 
 # 1) register your icon folder so resource_find() works at runtime:
 resource_add_path(str(Path(__file__).parent.parent / "img"))
+_START_IMG = resource_find("start.png")
+_BOAT_IMG  = resource_find("boat.png")
+
+# Per-fix map work is skipped for moves below these (anchored / slow drift)
+_M_PER_DEG = 111_320.0
+_RECENTER_M2 = 5.0 ** 2       # re-center the map after 5 m
+_MARKER_M2 = 0.5 ** 2         # move the boat marker after 0.5 m
+
+
+WAVE_TEMPLATE = "Wind {wind_speed_mph} mph   Sig  {sig_wave_ft} ft"
+
+
+class _DashDict(dict):
+    """format_map source that renders missing readings as a dash."""
+    def __missing__(self, key):
+        return "–"
+
+
+def _dist2_m(lat0, lon0, lat, lon):
+    """Squared equirectangular distance in m² (fine over a few hundred m)."""
+    dx = (lon - lon0) * cos(radians(lat0)) * _M_PER_DEG
+    dy = (lat - lat0) * _M_PER_DEG
+    return dx * dx + dy * dy
 
 
 class TrackScreen(Screen):
     # Your test / boating area center:
     DEFAULT_START = (42.177377, -80.034476)  # e.g. Lake Erie
 
+    _app = None                     # set while the screen is shown
+
     def on_enter(self):
         app = App.get_running_app()
 
@@ -29,68 +55,101 @@ class TrackScreen(Screen):
         mv = self.ids.mapview
         lat0, lon0 = self.DEFAULT_START
 
+        # constant while the screen is shown; saves per-fix lookups
+        self._app       = app
+        self._mv        = mv
+        self._speed_lbl = self.ids.speed_lbl
+        self._sess      = app.current_session
+
         # 3a) center map on your start
         mv.center_on(lat0, lon0)
-
-        # 3b) one-time “start” pin
-        img_start = resource_find("start.png")
-        if img_start:
-            # keep a reference so we can move it later
-            self._start_marker = MapMarker(lat=lat0, lon=lon0, source=img_start)
-            mv.add_widget(self._start_marker)
-
-        # 3c) create your “boat” marker at start too
-        img_boat = resource_find("boat.png")
-        self._pos_marker = MapMarker(lat=lat0, lon=lon0, source=img_boat)
-        mv.add_widget(self._pos_marker)
+        self._last_center = (lat0, lon0)
+
+        # 3b) “start” pin and 3c) “boat” marker: built on the first visit,
+        #     only moved back to the start on later ones
+        if getattr(self, "_pos_marker", None) is None:
+            self._start_marker = None
+            if _START_IMG:
+                # keep a reference so we can move it later
+                self._start_marker = MapMarker(lat=lat0, lon=lon0, source=_START_IMG)
+                mv.add_widget(self._start_marker)
+            self._pos_marker = MapMarker(lat=lat0, lon=lon0, source=_BOAT_IMG)
+            mv.add_widget(self._pos_marker)
+        else:
+            for marker in (self._start_marker, self._pos_marker):
+                if marker is not None:
+                    marker.lat, marker.lon = lat0, lon0
+        self._marker_pos = (lat0, lon0)
 
         # 4) subscribe GPS fixes & buoy timer
         self._first_fix = None
+        self._wx_count  = -1              # Weather.refresh_count last shown
         self._gps_cb    = app.gps.subscribe(self._on_fix)
-        self._wx_event  = Clock.schedule_interval(self.update_wave, 1800)
-        # update labels immediately
-        self.update_wave()
-
-        # Initialize the tracking line
-        self._route = MapLine(mapview=mv)
-        mv.add_widget(self._route)
+        self._wx_trigger = Clock.create_trigger(self._wx_tick, 1800)
+        app.weather.add_refresh_hook(self.update_wave)   # label follows each fetch
+        # log_gps() batches rows and flushes on append; this covers the case
+        # where fixes stop arriving (e.g. at anchor) with rows still queued.
+        self._flush_event = Clock.schedule_interval(lambda *_: db.flush_gps(), 10)
+        # update labels immediately (and arm the 30 min re-tick)
+        self._wx_tick()
+
+        # Tracking line: one widget for the screen's lifetime, emptied per visit
+        if getattr(self, "_route", None) is None:
+            self._route = MapLine(mapview=mv)
+            mv.add_widget(self._route)
+        else:
+            self._route.clear()
 
 
     def on_leave(self):
-        app = App.get_running_app()
-        app.gps.unsubscribe(self._gps_cb)
-        self._wx_event.cancel()
+        self._app.gps.unsubscribe(self._gps_cb)
+        self._wx_trigger.cancel()
+        self._app.weather.remove_refresh_hook(self.update_wave)
+        self._flush_event.cancel()
+        db.flush_gps()
+        self._app = self._mv = self._speed_lbl = self._sess = None
 
     def _on_fix(self, lat, lon, spd):
         """Called on every GPS fix."""
+        if self._app is None:
+            return                        # fix raced on_leave; screen is gone
         # 1) live speed label
-        self.ids.speed_lbl.text = f"{spd:4.1f} kn"
+        self._speed_lbl.text = f"{spd:4.1f} kn"
 
         # 2) persist fix
-        db.log_gps(App.get_running_app().current_session, lat, lon, speed_kph=spd)
+        db.log_gps(self._sess, lat, lon, speed_kph=spd)
 
         # 3) move your “boat” marker
-        self._pos_marker.lat = lat
-        self._pos_marker.lon = lon
+        if _dist2_m(*self._marker_pos, lat, lon) > _MARKER_M2:
+            self._pos_marker.lat = lat
+            self._pos_marker.lon = lon
+            self._marker_pos = (lat, lon)
 
         self._route.add_point(lat, lon)
 
 
         # 4) center map
-        self.ids.mapview.center_on(lat, lon)
+        if _dist2_m(*self._last_center, lat, lon) > _RECENTER_M2:
+            self._mv.center_on(lat, lon)
+            self._last_center = (lat, lon)
 
         # ——— on the very first real fix, snap the start pin to that position ———
         if self._first_fix is None:
             self._first_fix = (lat, lon)
             # reposition the start marker from DEFAULT_START to the user's actual start
-            self._start_marker.lat = lat
-            self._start_marker.lon = lon
+            if self._start_marker is not None:
+                self._start_marker.lat = lat
+                self._start_marker.lon = lon
+
+    def _wx_tick(self, *_):
+        self.update_wave()
+        self._wx_trigger()                # re-arm
 
     def update_wave(self, *_):
-        """Refresh buoy + update labels."""
-        w = App.get_running_app().weather
-        w.refresh()
-        self.ids.wave_lbl.text = (
-            f"Wind {w.wind_speed_mph or '–'} mph   "
-            f"Sig  {w.sig_wave_ft    or '–'} ft"
-        )
+        """Update labels from the cached buoy data (Weather polls itself)."""
+        w = self._app.weather
+        if w.refresh_count == self._wx_count:
+            return                        # same snapshot: keep the label as is
+        self._wx_count = w.refresh_count
+        self.ids.wave_lbl.text = WAVE_TEMPLATE.format_map(
+            _DashDict((k, v) for k, v in w.data.items() if v is not None))